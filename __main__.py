@@ -3,16 +3,28 @@ Library to hold sheet processing for arbitrary grouping of salary and finances
 """
 import logging
 import sys
+import functools
 import argparse
 import json
+from importlib import import_module
 from pathlib import Path
 from .openpyxl_adapter import OpenpyxlDataSource
+from .xlsx_adapter import XlsxDataSource
 from .processor import Processor, Operator
 
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_type(type_str: str, package: str):
+    """ Resolve an operator type string to its class, cached per type """
+    if "." in type_str:
+        module_path, class_name = type_str.rsplit(".", 1)
+        return getattr(import_module(module_path), class_name)
+    return getattr(import_module(".processor", package=package), type_str)
+
+
 def parse_operator(name: str, operator: Operator) -> Operator:
     """
     1. Create an instance of the class called type
@@ -20,15 +32,7 @@ def parse_operator(name: str, operator: Operator) -> Operator:
     3. Add other operators to this instance
     4. Return built
     """
-    from importlib import import_module
-
-    if "." in operator["type"]:
-        module_path, class_name = operator["type"].rsplit(".", 1)
-        module = import_module(module_path)
-        klass = getattr(module, class_name)
-    else:
-        module = import_module(".processor", package=__package__)
-        klass = getattr(module, operator["type"])
+    klass = _resolve_type(operator["type"], __package__)
     logger.debug(
         "Operator '%s' instantiated as '%s' args '%s'",
         name,
@@ -63,6 +67,15 @@ def main():
         help="optional config filename, otherwise source_wb.json is used.",
         type=Path,
     )
+    parser.add_argument(
+        "-r",
+        "--reader",
+        help="optional workbook reader. 'xlsx' streams the sheet XML directly but "
+        "returns date cells as serial numbers, not datetimes, which changes "
+        "matching and grouping on date columns.",
+        choices=["openpyxl", "xlsx"],
+        default="openpyxl",
+    )
     parser.add_argument(
         "-d",
         "--debug",
@@ -95,7 +108,12 @@ def main():
             )
         )
 
-    data_source = OpenpyxlDataSource(args.source_wb, header_row=config["header_row"])
+    if args.reader == "xlsx":
+        data_source = XlsxDataSource(args.source_wb, header_row=config["header_row"])
+    else:
+        data_source = OpenpyxlDataSource(
+            args.source_wb, header_row=config["header_row"]
+        )
     proc = Processor(data_source)
 
     for name, operator in config["operators"].items():
@@ -107,5 +125,5 @@ def main():
     pprint.pprint(proc.output())
 
 
-main()
-pass
+if __name__ == "__main__":
+    main()
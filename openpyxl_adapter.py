@@ -3,8 +3,6 @@ Adapters and interfaces for the aggregator to a spreadsheet
 """
 import logging
 from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter
 from .processor import DataIterator
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
@@ -14,44 +12,41 @@ class OpenpyxlDataSource(DataIterator):
     """ Provide a datasource based on openpyxl to read spreadsheets """
 
     def __init__(self, filename: Path, header_row: int, data_row: int = None):
-        self.header_row = header_row
-        if not data_row:
-            self.data_row = header_row + 1
-        else:
-            self.data_row = data_row
-
-        # Open workbook to worksheet
-        source_wb = load_workbook(filename)
-        source_ws = source_wb.active
-
-        # Map columns to names
-        row = next(source_ws.iter_rows(min_row=header_row))
-        self.mapping = {}
-        for cell in row:
-            if cell.value not in self.mapping.keys():
-                self.mapping[cell.column] = cell.value
-            else:
-                raise ValueError(
-                    "Column '{}' already defined in cell {}, rename column in {}".format(
-                        cell.value,
-                        get_column_letter(self.mapping[cell.value]) + str(header_row),
-                        cell.coordinate,
-                    )
-                )
-
-        logger.debug("Mapping: %s", self.mapping)
-
-        # Store row generator:
-        self.rows = source_ws.iter_rows(min_row=self.data_row)
+        # openpyxl is slow to import, only load it when a workbook is opened
+        from openpyxl import load_workbook
+        from openpyxl.utils import get_column_letter
+
+        # Open workbook to worksheet. Read only mode streams the rows from the
+        # sheet instead of building the whole workbook in memory.
+        self.source_wb = load_workbook(filename, read_only=True, data_only=True)
+        source_ws = self.source_wb.active
+
+        # Store row generator. Every iter_rows call parses the sheet from the
+        # start in read only mode, so the header is read from the same one.
+        # values_only yields tuples of values without building cell objects.
+        self.rows = source_ws.iter_rows(min_row=header_row, values_only=True)
+
+        # Map columns to names and skip to the data
+        self._read_header(self.rows, header_row, data_row, get_column_letter)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        """ Return dict as required """
-        row = next(self.rows)
-        row_content = {}
-        for cell in row:
-            row_content[self.mapping[cell.column]] = cell.value
+        """ Return the row values as a tuple in headers order """
+        try:
+            row_content = next(self.rows)
+        except StopIteration:
+            self.close()
+            raise
+        # Without a sheet dimension read only rows stop at the last value,
+        # so pad or cut them to the header width
+        width = len(self.headers)
+        if len(row_content) != width:
+            row_content = row_content[:width] + (None,) * (width - len(row_content))
         # logger.debug("Data: %s", row_content)
         return row_content
+
+    def close(self):
+        """ Release the workbook file handle held open by read only mode """
+        self.source_wb.close()
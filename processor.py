@@ -8,11 +8,101 @@ from abc import ABC, abstractmethod
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
+def _match_all(data):
+    return True
+
+
+def _compile_matches(matches: list):
+    """ Turn a [[label, value], ..] list into a predicate function with the
+    labels and values baked in, so data[label] == value .. is evaluated as
+    straight bytecode instead of looping over the list for every row.
+    """
+    if not matches:
+        return _match_all
+    names = ", ".join("c{0}=c{0}, v{0}=v{0}".format(i) for i in range(len(matches)))
+    test = " and ".join("data[c{0}] == v{0}".format(i) for i in range(len(matches)))
+    namespace = {}
+    for i, (label, value) in enumerate(matches):
+        namespace["c{}".format(i)] = label
+        namespace["v{}".format(i)] = value
+    return eval("lambda data, {}: {}".format(names, test), namespace)
+
+
+def _column(headers: list, label):
+    """ Return the row position of the column called label """
+    try:
+        return headers.index(label)
+    except ValueError:
+        raise ValueError(
+            "Column '{}' not found in data columns {}".format(label, headers)
+        ) from None
+
+
+def _overrides(operator, method: str) -> bool:
+    """ Return True if operator and every operator below it override method
+    of the Operator template
+    """
+    if getattr(type(operator), method) is getattr(Operator, method):
+        return False
+    return all(
+        _overrides(child, method) for child in getattr(operator, "operators", ())
+    )
+
+
 class DataIterator(ABC):
     """ Implements the data source implementing an iterator that
     returns a dict{key_str: value, ..} using ColumnMapper
+
+    If headers is set to the list of column names the iterator instead
+    returns each row as a list or tuple of values in headers order, and the
+    Processor binds its operators to the column positions before starting.
+    If any operator does not implement bind the Processor turns the rows
+    back into dicts, so operators always see the rows they can index.
     """
 
+    headers = None
+
+    def _read_header(self, rows, header_row: int, data_row: int, column_letter):
+        """ Map the columns named in the first of rows, the header_row, and
+        skip rows up to data_row. column_letter formats a 1 based column
+        number for the duplicate column error.
+        """
+        self.header_row = header_row
+        if not data_row:
+            self.data_row = header_row + 1
+        else:
+            self.data_row = data_row
+
+        # Map columns to names
+        row = next(rows)
+        self.mapping = {}
+        columns = {}
+        for column, value in enumerate(row, 1):
+            self.mapping[column] = value
+            # Blank header cells, such as spacer columns or the padding up to
+            # the widest row, may repeat
+            if value is None or value == "":
+                continue
+            if value not in columns:
+                columns[value] = column
+            else:
+                raise ValueError(
+                    "Column '{}' already defined in cell {}, rename column in {}".format(
+                        value,
+                        column_letter(columns[value]) + str(header_row),
+                        column_letter(column) + str(header_row),
+                    )
+                )
+
+        logger.debug("Mapping: %s", self.mapping)
+
+        # Column names in row order for building each data row
+        self.headers = [self.mapping[column] for column in sorted(self.mapping)]
+
+        # Skip any rows between the header and the data
+        for _ in range(self.data_row - header_row - 1):
+            next(rows)
+
     @abstractmethod
     def __iter__(self):
         pass
@@ -22,7 +112,7 @@ class DataIterator(ABC):
         pass
 
 
-class Operator(ABC):
+class Operator:
     """ Operator class template
     """
 
@@ -35,6 +125,27 @@ class Operator(ABC):
         """
         pass
 
+    def bind(self, headers: list):
+        """ Resolve the column names used by the operator to row positions in
+        headers, called before rows arrive as lists instead of dicts. Rows
+        stay dicts unless every operator in the tree overrides this.
+        """
+        pass
+
+    def clone(self):
+        """ Return a fresh copy of the operator, used by Grouper for each new
+        group. Override with a cheap constructor based copy where possible.
+        """
+        return deepcopy(self)
+
+    def reset(self):
+        """ Clear the results gathered by run, used before the Processor runs
+        its kept rows again
+        """
+        raise NotImplementedError(
+            "{} cannot be reset to run again".format(type(self).__name__)
+        )
+
 
 class Matcher(Operator):
     """ Matcher performs and AND match on its list, then invokes operators
@@ -44,30 +155,40 @@ class Matcher(Operator):
         self.matches = matches
         self.operators = []
         self.name = name
+        self._match = _compile_matches(matches)
 
     def add_operator(self, operator: Operator):
         self.operators.append(operator)
 
     def run(self, data):
-        match = True
-        if self.matches:
-            for label, value in self.matches:
-                if data[label] != value:
-                    match = False
-                    break
-        if not match:
+        if not self._match(data):
             return
 
-        logger.debug("Matcher '%s' '%s' hit.", self.name, self.matches)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Matcher '%s' '%s' hit.", self.name, self.matches)
         for operator in self.operators:
             operator.run(data)
 
-    def output(self):
-        output = {}
+    def bind(self, headers: list):
+        self._match = _compile_matches(
+            [[_column(headers, label), value] for label, value in self.matches]
+        )
         for operator in self.operators:
-            name, result = operator.output()
-            output[name] = result
-        return (self.name, output)
+            operator.bind(headers)
+
+    def clone(self):
+        # Share the compiled predicate rather than compiling it again
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.operators = [operator.clone() for operator in self.operators]
+        return clone
+
+    def reset(self):
+        for operator in self.operators:
+            operator.reset()
+
+    def output(self):
+        return (self.name, dict(operator.output() for operator in self.operators))
 
 
 class Filter(Operator):
@@ -78,30 +199,40 @@ class Filter(Operator):
         self.matches = matches
         self.operators = []
         self.name = name
+        self._match = _compile_matches(matches)
 
     def add_operator(self, operator: Operator):
         self.operators.append(operator)
 
     def run(self, data):
-        match = True
-        if self.matches:
-            for label, value in self.matches:
-                if data[label] != value:
-                    match = False
-                    break
-        if match:
-            logger.debug("Filter '%s' '%s' hit.", self.name, self.matches)
+        if self._match(data):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Filter '%s' '%s' hit.", self.name, self.matches)
             return
 
         for operator in self.operators:
             operator.run(data)
 
-    def output(self):
-        output = {}
+    def bind(self, headers: list):
+        self._match = _compile_matches(
+            [[_column(headers, label), value] for label, value in self.matches]
+        )
         for operator in self.operators:
-            name, result = operator.output()
-            output[name] = result
-        return (self.name, output)
+            operator.bind(headers)
+
+    def clone(self):
+        # Share the compiled predicate rather than compiling it again
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.operators = [operator.clone() for operator in self.operators]
+        return clone
+
+    def reset(self):
+        for operator in self.operators:
+            operator.reset()
+
+    def output(self):
+        return (self.name, dict(operator.output() for operator in self.operators))
 
 
 class Grouper(Operator):
@@ -113,30 +244,52 @@ class Grouper(Operator):
         self.operators = []
         self.name = name
         self.groups = {}
+        self._column = group_by
 
     def add_operator(self, operator: Operator):
         self.operators.append(operator)
 
     def run(self, data):
-        if data[self.group_by] not in self.groups:
-            self.groups[data[self.group_by]] = deepcopy(self.operators)
-            logger.debug(
-                "Grouper '%s' '%s' created new group '%s'",
-                self.name,
-                self.group_by,
-                data[self.group_by],
-            )
-        for operator in self.groups[data[self.group_by]]:
+        key = data[self._column]
+        group = self.groups.get(key)
+        if group is None:
+            group = [operator.clone() for operator in self.operators]
+            self.groups[key] = group
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Grouper '%s' '%s' created new group '%s'",
+                    self.name,
+                    self.group_by,
+                    key,
+                )
+        for operator in group:
             operator.run(data)
 
-    def output(self):
-        output = {}
-        for name, group in self.groups.items():
-            output[name] = {}
+    def bind(self, headers: list):
+        self._column = _column(headers, self.group_by)
+        for operator in self.operators:
+            operator.bind(headers)
+        for group in self.groups.values():
             for operator in group:
-                group_name, result = operator.output()
-                output[name][group_name] = result
-        return (self.name, output)
+                operator.bind(headers)
+
+    def clone(self):
+        clone = type(self)(self.name, self.group_by)
+        clone._column = self._column
+        clone.operators = [operator.clone() for operator in self.operators]
+        return clone
+
+    def reset(self):
+        self.groups = {}
+
+    def output(self):
+        return (
+            self.name,
+            {
+                name: dict(operator.output() for operator in group)
+                for name, group in self.groups.items()
+            },
+        )
 
 
 class Summer(Operator):
@@ -148,33 +301,60 @@ class Summer(Operator):
         self.var_name = var_name
         self.name = name
         self.total = 0
+        self.skipped = 0
+        self._column = var_name
 
     def run(self, data):
-        try:
-            self.total += data[self.var_name]
-            logger.debug(
-                "Summer '%s' '%s' total %s", self.name, self.var_name, self.total
-            )
-        except TypeError:
+        value = data[self._column]
+        if type(value) is int or type(value) is float:
+            self.total += value
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Summer '%s' '%s' total %s", self.name, self.var_name, self.total
+                )
+        else:
+            self.skipped += 1
+
+    def bind(self, headers: list):
+        self._column = _column(headers, self.var_name)
+
+    def clone(self):
+        clone = type(self)(self.name, self.var_name)
+        clone._column = self._column
+        return clone
+
+    def reset(self):
+        self.total = 0
+        self.skipped = 0
+
+    def output(self):
+        if self.skipped:
             logger.info(
-                "Summer '%s' '%s' total %s - cowardly not adding non-numeric type.",
+                "Summer '%s' '%s' total %s - cowardly skipped %s non-numeric values.",
                 self.name,
                 self.var_name,
                 self.total,
+                self.skipped,
             )
-
-    def output(self):
         return (self.name, self.total)
 
 
 class Processor:
     """ Machinery to apply the matches to the data from the datasource."""
 
-    def __init__(self, data_iterator: DataIterator, name: str = None):
+    def __init__(
+        self, data_iterator: DataIterator, name: str = None, keep_rows: bool = False
+    ):
         """
         Iterate over the data_iterator grouping matches by match.
+
+        With keep_rows the rows are held in memory after the first start so
+        that start can be called again without reading the source.
         """
         self.data_iterator = data_iterator
+        self.keep_rows = keep_rows
+        self._cached_rows = None
+        self._started = False
 
         self.operators = list()
 
@@ -184,17 +364,61 @@ class Processor:
         """
         self.operators.append(new_operator)
 
+    def _bind_columns(self, headers: list):
+        """
+        Point the operators at row positions instead of column names
+        """
+        for operator in self.operators:
+            operator.bind(headers)
+
     def start(self):
         """
         Iterate over the data_iterator, matching and grouping.
+
+        With keep_rows, calling start again resets the operators and runs the
+        kept rows through them, replacing the previous results.
         """
-        for data in self.data_iterator:
+        if self._started:
+            if not self.keep_rows:
+                logger.warning(
+                    "Data source already read, create the Processor with "
+                    "keep_rows=True to run start again."
+                )
+                return
             for operator in self.operators:
-                operator.run(data)
+                operator.reset()
+        self._started = True
+
+        rows = self._rows()
+        headers = self.data_iterator.headers
+        if headers is not None:
+            if all(_overrides(operator, "bind") for operator in self.operators):
+                self._bind_columns(headers)
+            else:
+                logger.info("Operators without bind, passing rows as dicts.")
+                rows = (dict(zip(headers, row)) for row in rows)
+
+        runs = [operator.run for operator in self.operators]
+        for data in rows:
+            for run in runs:
+                run(data)
+
+    def _rows(self):
+        """
+        Yield the data rows, with keep_rows keeping them once the
+        data_iterator is exhausted
+        """
+        if self._cached_rows is not None:
+            yield from self._cached_rows
+            return
+        if not self.keep_rows:
+            yield from self.data_iterator
+            return
+        rows = []
+        for data in self.data_iterator:
+            rows.append(data)
+            yield data
+        self._cached_rows = rows
 
     def output(self):
-        output = {}
-        for operator in self.operators:
-            name, result = operator.output()
-            output[name] = result
-        return output
+        return dict(operator.output() for operator in self.operators)
@@ -0,0 +1,206 @@
+"""
+Tests for the processor and its operators
+"""
+import pytest
+from ..processor import (
+    DataIterator,
+    Filter,
+    Grouper,
+    Matcher,
+    Operator,
+    Processor,
+    Summer,
+)
+
+HEADERS = ["dept", "kind", "amt"]
+ROWS = [
+    ("Sales", "pay", 10),
+    ("Sales", "bonus", 5),
+    ("Eng", "pay", 7.5),
+    ("Eng", "pay", None),
+    ("Ops", "pay", 1),
+]
+
+
+class RowSource(DataIterator):
+    """ Yield ROWS as tuples with headers, or as dicts without """
+
+    def __init__(self, as_dicts: bool = False):
+        if as_dicts:
+            self.rows = iter([dict(zip(HEADERS, row)) for row in ROWS])
+        else:
+            self.headers = HEADERS
+            self.rows = iter(ROWS)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.rows)
+
+
+class Counter(Operator):
+    """ Plug-in style operator that indexes rows by column name """
+
+    def __init__(self, name: str, column: str):
+        self.name = name
+        self.column = column
+        self.seen = []
+
+    def run(self, data):
+        self.seen.append(data[self.column])
+
+    def output(self):
+        return (self.name, self.seen)
+
+
+def build(source: DataIterator) -> Processor:
+    processor = Processor(source)
+    sales = Matcher("sales", [["dept", "Sales"]])
+    sales.add_operator(Summer("total", "amt"))
+    processor.add_operator(sales)
+    not_sales = Filter("not_sales", [["dept", "Sales"]])
+    not_sales.add_operator(Summer("total", "amt"))
+    processor.add_operator(not_sales)
+    by_dept = Grouper("by_dept", "dept")
+    pay = Matcher("pay", [["kind", "pay"]])
+    pay.add_operator(Summer("total", "amt"))
+    by_dept.add_operator(pay)
+    by_dept.add_operator(Summer("all", "amt"))
+    processor.add_operator(by_dept)
+    return processor
+
+
+EXPECTED = {
+    "sales": {"total": 15},
+    "not_sales": {"total": 8.5},
+    "by_dept": {
+        "Sales": {"pay": {"total": 10}, "all": 15},
+        "Eng": {"pay": {"total": 7.5}, "all": 7.5},
+        "Ops": {"pay": {"total": 1}, "all": 1},
+    },
+}
+
+
+@pytest.mark.parametrize("as_dicts", [False, True])
+def test_output_matches_for_both_row_shapes(as_dicts):
+    processor = build(RowSource(as_dicts))
+    processor.start()
+    assert processor.output() == EXPECTED
+
+
+def test_tuple_rows_bind_to_positions():
+    processor = build(RowSource())
+    processor.start()
+    summer = processor.operators[0].operators[0]
+    assert summer._column == HEADERS.index("amt")
+    assert processor.operators[2]._column == HEADERS.index("dept")
+
+
+def test_plugin_operator_gets_dict_rows():
+    processor = Processor(RowSource())
+    sales = Matcher("sales", [["dept", "Sales"]])
+    sales.add_operator(Counter("kinds", "kind"))
+    sales.add_operator(Summer("total", "amt"))
+    processor.add_operator(sales)
+    processor.start()
+    assert processor.output() == {"sales": {"kinds": ["pay", "bonus"], "total": 15}}
+    assert sales.operators[1]._column == "amt"
+
+
+def test_unknown_column_raises_at_bind():
+    processor = Processor(RowSource())
+    processor.add_operator(Summer("total", "missing"))
+    with pytest.raises(ValueError, match="missing"):
+        processor.start()
+
+
+@pytest.mark.parametrize("as_dicts", [False, True])
+def test_matcher_and_filter_semantics(as_dicts):
+    processor = Processor(RowSource(as_dicts))
+    for klass, name, matches in [
+        (Matcher, "sales_pay", [["dept", "Sales"], ["kind", "pay"]]),
+        (Matcher, "everything", []),
+        (Matcher, "list_value", [["dept", ["Sales"]]]),
+        (Filter, "not_sales_pay", [["dept", "Sales"], ["kind", "pay"]]),
+        (Filter, "nothing", []),
+    ]:
+        operator = klass(name, matches)
+        operator.add_operator(Summer("rows", "amt"))
+        processor.add_operator(operator)
+    processor.start()
+    assert processor.output() == {
+        "sales_pay": {"rows": 10},
+        "everything": {"rows": 23.5},
+        "list_value": {"rows": 0},
+        "not_sales_pay": {"rows": 13.5},
+        "nothing": {"rows": 0},
+    }
+
+
+def test_matcher_subclass_run_is_called():
+    class CountingMatcher(Matcher):
+        calls = 0
+
+        def run(self, data):
+            CountingMatcher.calls += 1
+            super().run(data)
+
+    processor = Processor(RowSource())
+    processor.add_operator(CountingMatcher("first", [["dept", "Sales"]]))
+    processor.add_operator(CountingMatcher("second", [["dept", "Sales"]]))
+    processor.start()
+    assert CountingMatcher.calls == 2 * len(ROWS)
+
+
+def test_matcher_clone_shares_predicate_not_results():
+    matcher = Matcher("sales", [["dept", "Sales"]])
+    matcher.add_operator(Summer("total", "amt"))
+    clone = matcher.clone()
+    assert clone._match is matcher._match
+    clone.run({"dept": "Sales", "amt": 3})
+    assert clone.output() == ("sales", {"total": 3})
+    assert matcher.output() == ("sales", {"total": 0})
+
+
+def test_read_header_maps_columns_and_skips_to_data():
+    source = RowSource()
+    rows = iter([("dept", None, "amt", None), ("units",), ("Sales", 1, 2, 3)])
+    source._read_header(rows, 2, 4, str)
+    assert source.headers == ["dept", None, "amt", None]
+    assert source.mapping == {1: "dept", 2: None, 3: "amt", 4: None}
+    assert next(rows) == ("Sales", 1, 2, 3)
+
+
+def test_read_header_rejects_duplicate_columns():
+    source = RowSource()
+    message = "already defined in cell 12, rename column in 32"
+    with pytest.raises(ValueError, match=message):
+        source._read_header(iter([("amt", "dept", "amt")]), 2, None, str)
+
+
+@pytest.mark.parametrize("as_dicts", [False, True])
+def test_keep_rows_replay_resets_operators_in_place(as_dicts):
+    processor = build(RowSource(as_dicts))
+    processor.keep_rows = True
+    summer = processor.operators[0].operators[0]
+    processor.start()
+    processor.start()
+    assert processor.output() == EXPECTED
+    assert summer.output() == ("total", 15)
+
+
+def test_second_start_without_keep_rows_warns(caplog):
+    processor = build(RowSource())
+    processor.start()
+    processor.start()
+    assert processor.output() == EXPECTED
+    assert "keep_rows=True" in caplog.text
+
+
+def test_replay_without_reset_raises():
+    processor = Processor(RowSource(as_dicts=True), keep_rows=True)
+    processor.add_operator(Counter("kinds", "kind"))
+    processor.start()
+    with pytest.raises(NotImplementedError):
+        processor.start()
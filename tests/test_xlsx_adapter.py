@@ -0,0 +1,85 @@
+"""
+Tests for the streaming xlsx data source
+"""
+import zipfile
+from ..xlsx_adapter import XlsxDataSource
+
+NS = (
+    'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+SHARED = ["dept", "amt", "Sales", "Eng"]
+
+
+def write_xlsx(path, rows):
+    """ Write a minimal workbook whose only sheet holds the given row XML """
+    shared = "".join("<si><t>{}</t></si>".format(text) for text in SHARED)
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            '<workbook {}><sheets><sheet name="Data" sheetId="1" r:id="rId1"/>'
+            "</sheets></workbook>".format(NS),
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships"><Relationship Id="rId1" Target="worksheets/sheet1.xml"'
+            ' Type="worksheet"/></Relationships>',
+        )
+        archive.writestr("xl/sharedStrings.xml", "<sst {}>{}</sst>".format(NS, shared))
+        archive.writestr(
+            "xl/worksheets/sheet1.xml",
+            "<worksheet {}><sheetData>{}</sheetData></worksheet>".format(
+                NS, "".join(rows)
+            ),
+        )
+    return path
+
+
+def test_rows_without_numbers(tmp_path):
+    filename = write_xlsx(
+        tmp_path / "book.xlsx",
+        [
+            '<row><c t="inlineStr"><is><t>Title</t></is></c></row>',
+            '<row><c t="s"><v>0</v></c><c t="s"><v>1</v></c>'
+            '<c t="inlineStr"><is><t>kind</t></is></c></row>',
+            '<row><c t="s"><v>2</v></c><c><v>10</v></c><c t="b"><v>1</v></c></row>',
+            '<row><c t="s"><v>3</v></c><c t="e"><v>#N/A</v></c></row>',
+            '<row r="6"><c r="B6"><v>2.5</v></c><c r="D6"><v>1</v></c></row>',
+        ],
+    )
+    source = XlsxDataSource(filename, header_row=2)
+    assert source.headers == ["dept", "amt", "kind"]
+    assert list(source) == [
+        ["Sales", 10, True],
+        ["Eng", "#N/A", None],
+        [None, None, None],
+        [None, 2.5, None],
+    ]
+
+
+def test_data_row_offset(tmp_path):
+    filename = write_xlsx(
+        tmp_path / "book.xlsx",
+        [
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>',
+            '<row r="2"><c r="A2" t="inlineStr"><is><t>units</t></is></c></row>',
+            '<row r="3"><c r="A3" t="s"><v>2</v></c><c r="B3"><v>1E2</v></c></row>',
+        ],
+    )
+    source = XlsxDataSource(filename, header_row=1, data_row=3)
+    assert list(source) == [["Sales", 100.0]]
+
+
+def test_repeated_blank_headers(tmp_path):
+    filename = write_xlsx(
+        tmp_path / "book.xlsx",
+        [
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="C1" t="s"><v>1</v></c>'
+            '<c r="E1"><v>5</v></c></row>',
+            '<row r="2"><c r="A2" t="s"><v>2</v></c><c r="C2"><v>3</v></c></row>',
+        ],
+    )
+    source = XlsxDataSource(filename, header_row=1)
+    assert source.headers == ["dept", None, "amt", None, 5]
+    assert list(source) == [["Sales", None, 3, None, None]]
@@ -0,0 +1,183 @@
+"""
+Streaming xlsx reader for the aggregator, reading the sheet XML directly
+"""
+import logging
+import posixpath
+import zipfile
+from pathlib import Path
+from xml.etree.ElementTree import fromstring, iterparse
+from .processor import DataIterator
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _column_number(reference: str) -> int:
+    """ Return the 1 based column number of a cell reference such as 'AB12' """
+    number = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        number = number * 26 + ord(char.upper()) - 64
+    return number
+
+
+def _column_letter(number: int) -> str:
+    """ Return the column letters of a 1 based column number """
+    letters = ""
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _text(element) -> str:
+    """ Join the text runs of a shared or inline string, skipping phonetics """
+    text = element.find(MAIN_NS + "t")
+    if text is not None:
+        return text.text or ""
+    return "".join(
+        run.text or "" for run in element.iterfind("{0}r/{0}t".format(MAIN_NS))
+    )
+
+
+def _load_shared_strings(archive: zipfile.ZipFile) -> list:
+    """ Read the shared string table, if the workbook has one """
+    try:
+        source = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    strings = []
+    with source:
+        for _, element in iterparse(source):
+            if element.tag == MAIN_NS + "si":
+                strings.append(_text(element))
+                element.clear()
+    return strings
+
+
+def _active_sheet_path(archive: zipfile.ZipFile) -> str:
+    """ Find the archive path of the active worksheet """
+    workbook = fromstring(archive.read("xl/workbook.xml"))
+    view = workbook.find("{0}bookViews/{0}workbookView".format(MAIN_NS))
+    active = int(view.get("activeTab", 0)) if view is not None else 0
+    sheet = workbook.findall("{0}sheets/{0}sheet".format(MAIN_NS))[active]
+    rel_id = sheet.get(REL_NS + "id")
+
+    rels = fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(PKG_REL_NS + "Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target")
+            if target.startswith("/"):
+                return target[1:]
+            return posixpath.normpath(posixpath.join("xl", target))
+    raise ValueError(
+        "Sheet '{}' has no relationship '{}'".format(sheet.get("name"), rel_id)
+    )
+
+
+class XlsxDataSource(DataIterator):
+    """ Provide a datasource streaming the active sheet of an xlsx file.
+
+    Reads the sheet XML row by row without openpyxl's cell objects, styles or
+    validation. Cells formatted as dates are returned as their serial numbers
+    rather than datetimes as no number formats are read.
+    """
+
+    def __init__(self, filename: Path, header_row: int, data_row: int = None):
+        # Open the workbook archive and the active worksheet XML
+        self.archive = zipfile.ZipFile(filename)
+        self.shared_strings = _load_shared_strings(self.archive)
+        self.source_ws = self.archive.open(_active_sheet_path(self.archive))
+
+        # Store row generator, reading the header from the same one
+        self.rows = self._iter_rows(header_row)
+
+        # Map columns to names and skip to the data
+        self._read_header(self.rows, header_row, data_row, _column_letter)
+
+    def _iter_rows(self, min_row: int):
+        """ Yield the values of every row from min_row as lists, including
+        empty lists for rows missing from the sheet XML
+        """
+        shared_strings = self.shared_strings
+        row_tag = MAIN_NS + "row"
+        value_tag = MAIN_NS + "v"
+        inline_tag = MAIN_NS + "is"
+
+        sheet_data = None
+        last_row = 0
+        next_row = min_row
+        for event, element in iterparse(self.source_ws, events=("start", "end")):
+            if event == "start":
+                if element.tag == MAIN_NS + "sheetData":
+                    sheet_data = element
+                continue
+            if element.tag != row_tag:
+                continue
+
+            # The row number is optional, without it rows follow on in order
+            row_number = int(element.get("r", last_row + 1))
+            last_row = row_number
+            if row_number >= min_row:
+                while next_row < row_number:
+                    yield []
+                    next_row += 1
+
+                values = []
+                for cell in element:
+                    reference = cell.get("r")
+                    if reference:
+                        missing = _column_number(reference) - 1 - len(values)
+                        values.extend([None] * missing)
+
+                    cell_type = cell.get("t", "n")
+                    if cell_type == "inlineStr":
+                        inline = cell.find(inline_tag)
+                        values.append(_text(inline) if inline is not None else None)
+                        continue
+                    value = cell.find(value_tag)
+                    if value is None or value.text is None:
+                        values.append(None)
+                    elif cell_type == "s":
+                        values.append(shared_strings[int(value.text)])
+                    elif cell_type == "b":
+                        values.append(value.text == "1")
+                    elif cell_type in ("str", "e", "d"):
+                        values.append(value.text)
+                    elif "." in value.text or "E" in value.text or "e" in value.text:
+                        values.append(float(value.text))
+                    else:
+                        values.append(int(value.text))
+                yield values
+                next_row = row_number + 1
+
+            # Drop the parsed row so the tree does not grow with the sheet
+            if sheet_data is not None:
+                sheet_data.remove(element)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """ Return the row values as a list in headers order """
+        try:
+            row_content = next(self.rows)
+        except StopIteration:
+            self.close()
+            raise
+        width = len(self.headers)
+        if len(row_content) < width:
+            row_content.extend([None] * (width - len(row_content)))
+        elif len(row_content) > width:
+            del row_content[width:]
+        # logger.debug("Data: %s", row_content)
+        return row_content
+
+    def close(self):
+        """ Release the workbook file handles """
+        self.source_ws.close()
+        self.archive.close()